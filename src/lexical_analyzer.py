@@ -11,10 +11,45 @@ and outputs the results in JSON format. It handles:
 """
 
 import re
-from typing import List
+try:
+    import orjson  # Fast JSON encoder, used by convert_json()
+except ImportError:
+    orjson = None
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
 import os
+import sys
 import json
 
+# Comments skipped by read_text_file(): multi-line (an unclosed one runs
+# to the end of the file) and single-line (// style)
+_RE_COMMENT = re.compile(r'/\*[\s\S]*?(?:\*/|\Z)|//[^\n]*')
+
+# Tokens found on each line. Any other character (whitespace, '@', ...)
+# is skipped
+_RE_TOKEN = re.compile(
+    r'[0-9]+\.[0-9]+'               # Floating point numbers (e.g., 3.14)
+    r'|[0-9]+'                      # Integers (e.g., 42)
+    r'|[a-zA-Z_][a-zA-Z0-9_]*'      # Identifiers (e.g., variable_name)
+    r'|[;:,(){}\[\]<>=+\-*/]'       # Special characters (operators and delimiters)
+)
+
+# Token categories reported by categorize_tokens()
+_CATEGORIES = ('identifier', 'number', 'keyword', 'operator', 'delimiters')
+
+# Fixed lexemes for each category used by categorize_tokens(). Interned
+# like the scanned tokens, so lookups can match them by identity
+_KEYWORDS = frozenset(map(sys.intern, ("if", "else", "while", "for", "return", "int", "float", "char")))
+_OPERATORS = frozenset(map(sys.intern, ("+", "-", "*", "/", "%", "**", "//", "=")))
+_DELIMITERS = frozenset(map(sys.intern, ("(", ")", "{", "}", "[", "]", ",", ";")))
+
+# Category of every fixed lexeme, so they are classified with one lookup
+_FIXED_CATEGORIES = {
+    **dict.fromkeys(_KEYWORDS, 'keyword'),
+    **dict.fromkeys(_OPERATORS, 'operator'),
+    **dict.fromkeys(_DELIMITERS, 'delimiters'),
+}
+
 
 def read_text_file(file_path: str, mode: str = 'r', encoding: str = 'utf-8') -> List[List[str]]:
     """
@@ -31,162 +66,205 @@ def read_text_file(file_path: str, mode: str = 'r', encoding: str = 'utf-8') ->
     Raises:
         FileNotFoundError: If the specified file doesn't exist
     """
-    textLines = []  # Stores the final tokenized lines
-    isOnAComment = False  # Flag for multi-line comment tracking
-    
     try:
+        # Read the whole file at once; this also works for pipes and
+        # encodings that are not ASCII-compatible
         with open(file_path, mode, encoding=encoding) as file:
-            # Process each line in the file
-            for line in file:
-                # Skip if we're inside a multi-line comment block
-                if isOnAComment:
-                    # Check if this line contains the end of the comment
-                    if re.search(r"\*/", line):
-                        isOnAComment = False
-                    continue
-                
-                # Skip empty lines (whitespace only)
-                if line.strip() == "":
-                    continue
-                
-                # Skip single-line comments (// style)
-                if re.match(r"^\s*\/\/.*", line): 
-                    continue
-                
-                # Handle start of multi-line comments (/* style)
-                if re.match(r"^\s*\/\*", line):
-                    # Check if comment ends on same line
-                    if not re.search(r"\*/", line):
-                        isOnAComment = True
-                    continue
-                
-                # Process the line to separate tokens
-                tokens = []
-                line_text = line.strip()  # Remove leading/trailing whitespace
-                
-                # Regex pattern to match:
-                # - Floating point numbers (e.g., 3.14)
-                # - Integers (e.g., 42)
-                # - Identifiers (e.g., variable_name)
-                # - Special characters (operators and delimiters)
-                pattern = r'([0-9]+\.[0-9]+|[0-9]+|[a-zA-Z_][a-zA-Z0-9_]*|[;:,\(\)\{\}\[\]<>=\+\-\*/])'
-                
-                # Find all tokens in the line
-                matches = list(re.finditer(pattern, line_text))
-                
-                # Process each matched token
-                for match in matches:
-                    token = match.group(0)
-                    
-                    # Handle cases where tokens might be incorrectly concatenated:
-                    # Case 1: When a special character follows another token (e.g., '42;')
-                    if len(token) > 1 and token[-1] in ';:,(){}[]<>=+-*/':
-                        tokens.append(token[:-1])  # Add the main token
-                        tokens.append(token[-1])  # Add the special character
-                    
-                    # Case 2: When a special character precedes another token (e.g., '(x')
-                    elif len(token) > 1 and token[0] in ';:,(){}[]<>=+-*/':
-                        tokens.append(token[0])    # Add the special character
-                        tokens.append(token[1:])   # Add the remaining token
-                    
-                    # Normal case: add the token as-is
-                    else:
-                        tokens.append(token)
-                
-                # Add non-empty token lists to our results
-                if tokens:
-                    textLines.append(tokens)
-                
+            return _scan_tokens(file.read())
     except FileNotFoundError:
         raise FileNotFoundError(f"The file '{file_path}' was not found")
+
+
+def _replace_comment(match: re.Match) -> str:
+    """
+    Replaces a comment with the newlines it spans, so line breaks are kept.
+    
+    Args:
+        match: Match of _RE_COMMENT
+    
+    Returns:
+        The newlines of the comment, or a space if it has none
+    """
+    return '\n' * match.group().count('\n') or ' '
+
+
+def _scan_tokens(data: str) -> List[List[str]]:
+    """
+    Splits source text into lines of tokens, skipping comments.
+    
+    Args:
+        data: File contents
+    
+    Returns:
+        A list of lines, each containing a list of tokens
+    """
+    textLines = []  # Stores the final tokenized lines
+    findall = _RE_TOKEN.findall
+    
+    for line in _RE_COMMENT.sub(_replace_comment, data).split('\n'):
+        tokens = findall(line)
+        if tokens:
+            # Interning makes repeated lexemes share a single string object,
+            # which also speeds up the set and dict lookups done on them later
+            textLines.append(list(map(sys.intern, tokens)))
     
     return textLines
 
 
-def categorize_tokens(array: List[List[str]]) -> List[dict]:
+def _is_identifier(lexeme: str) -> bool:
+    """
+    Checks if a lexeme is an identifier: an ASCII letter followed by
+    ASCII letters, digits or underscores. Same as the regex
+    [a-zA-Z][a-zA-Z0-9_]* without going through the regex engine.
+    """
+    return lexeme[:1].isalpha() and lexeme.isascii() and lexeme.replace('_', '').isalnum()
+
+
+def _classify(lexeme: str) -> str:
+    """
+    Determines the category of a single lexeme.
+    
+    Args:
+        lexeme: Token text
+    
+    Returns:
+        The category name, or 'not identified' if no category matches
+    """
+    category = _FIXED_CATEGORIES.get(lexeme)
+    if category is not None:
+        return category
+    if lexeme.isdecimal():
+        return 'number'
+    if _is_identifier(lexeme):
+        return 'identifier'
+    return 'not identified'
+
+
+def categorize_tokens(array: List[List[str]], verbose: bool = False) -> Dict[str, list]:
     """
     Categorizes tokens into lexical categories and generates JSON output.
     
     Args:
         array: List of tokenized lines from read_text_file()
+        verbose: Print unidentified lexemes and the lexemes found for
+            each category
     
     Returns:
-        List of dictionaries containing token information with:
+        Token information as parallel lists, one entry per token:
         - id: Unique identifier
         - content: The token text
         - type: Token category
     """
-    # Define token patterns and categories
-    tokenDefinitions = {
-        'identifier': re.compile(r"^[a-zA-Z][a-zA-Z0-9_]*$"),  # Variable/function names
-        'number': re.compile(r"^\d+$"),                        # Integer numbers
-        'float': re.compile(r"^\d+\.\d+$"),                     # Floating point numbers
-        'keyword': {"if", "else", "while", "for", "return", "int", "float", "char"},  
-        'operator': {"+", "-", "*", "/", "%", "**", "//", "="},
-        'delimiters': {"(", ")", "{", "}", "[", "]", ",", ";"}
-    }
-
-    # Initialize storage for each token category
-    listOfTokens = ['identifier', 'number', 'keyword', 'operator', 'delimiters']
-    tokens = {category: set() for category in listOfTokens}
-
-    print("Input array:", array)  # Debug output
-    
-    # Prepare JSON output structure
-    type = ''       # Token category
-    id = 0          # Unique token identifier
-    json_token = {} # Individual token data
-    json_tokens = [] # Complete token list
+    # Prepare JSON output structure. Each field is kept in its own list
+    # instead of building a dictionary per token
+    contents = []    # Token text
+    types = []       # Token category
+    categories = {}  # Category of every distinct lexeme seen so far
     
     # Process each token in the input
     for line in array:
         for lexeme in line:
-            print("\nProcessing lexeme:", lexeme)  # Debug output
-            
-            # Determine token category
-            if lexeme in tokenDefinitions['keyword']:
-                tokens['keyword'].add(lexeme)
-                type = 'keyword'                
-            elif lexeme in tokenDefinitions['operator']:
-                tokens['operator'].add(lexeme)
-                type = 'operator'   
-            elif lexeme in tokenDefinitions['delimiters']:
-                tokens['delimiters'].add(lexeme)
-                type = 'delimiters'
-            elif tokenDefinitions['number'].fullmatch(lexeme):
-                tokens['number'].add(lexeme)
-                type = 'number'
-            elif tokenDefinitions['identifier'].fullmatch(lexeme):
-                tokens['identifier'].add(lexeme)
-                type = 'identifier'
-            else:
-                print("not identified")  # Debug output
-                type = 'not identified'
+            # Determine token category. Source code repeats the same
+            # lexemes a lot, so each distinct lexeme is classified once
+            type = categories.get(lexeme)
+            if type is None:
+                type = categories[lexeme] = _classify(lexeme)
+                if verbose and type == 'not identified':
+                    print(f"{lexeme!r} not identified")
             
-            # Create token entry for JSON output
-            json_token = {
-                "id": id,
-                "content": lexeme,
-                "type": type               
-            }
-            json_tokens.append(json_token)
-            id += 1  # Increment unique ID
+            contents.append(lexeme)
+            types.append(type)
     
-    print(tokens)  # Debug output: show categorized tokens
+    # Debug output: show categorized tokens. The sets are only needed
+    # here, so they are built from the distinct lexemes afterwards
+    if verbose:
+        tokens = {category: set() for category in _CATEGORIES}
+        for lexeme, type in categories.items():
+            if type != 'not identified':
+                tokens[type].add(lexeme)
+        print(tokens)
 
-    return json_tokens
+    # Tokens are numbered in order of appearance
+    return {"id": list(range(len(contents))), "content": contents, "type": types}
 
 
-def convert_json(json_file_name: str, data: List[dict]) -> None:
+# Number of token objects encoded per call in convert_json()
+_JSON_BATCH_SIZE = 4096
+
+
+def _encode_tokens(tokens: list) -> bytes:
+    """
+    Pretty-prints a list of token objects as UTF-8 JSON. Uses orjson when
+    available; the stdlib fallback produces exactly the same bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(tokens, option=orjson.OPT_INDENT_2)
+    return json.dumps(tokens, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def convert_json(json_file_name: str, data: Dict[str, list]) -> None:
     """
-    Saves token data to a JSON file.
+    Saves token data to a JSON file as a list of token objects.
+    
+    Tokens are encoded and written in batches, so neither all the token
+    objects nor the whole JSON text are held in memory at once.
     
     Args:
         json_file_name: Path to output JSON file
-        data: Token data to serialize
+        data: Token data from categorize_tokens()
+    """
+    with open(json_file_name, "wb") as json_file:
+        if not data["id"]:
+            json_file.write(b"[]")
+            return
+        
+        ids, contents, types = data["id"], data["content"], data["type"]
+        separator = b"[\n"  # Written before each batch
+        for start in range(0, len(ids), _JSON_BATCH_SIZE):
+            end = start + _JSON_BATCH_SIZE
+            batch = _encode_tokens([
+                {"id": id, "content": content, "type": type}
+                for id, content, type in zip(ids[start:end], contents[start:end], types[start:end])
+            ])
+            
+            # Drop the batch's own "[\n" and "\n]" so the items join into one list
+            json_file.write(separator)
+            json_file.write(batch[2:-2])
+            separator = b",\n"
+        json_file.write(b"\n]")
+
+
+def _tokenize_file(file_path: str) -> Dict[str, list]:
+    """
+    Runs the tokenization pipeline on a single file (worker task).
+    """
+    return categorize_tokens(read_text_file(file_path))
+
+
+def tokenize_files(file_paths: List[str], max_workers: Optional[int] = None) -> List[Dict[str, list]]:
+    """
+    Tokenizes and categorizes several files in parallel.
+    
+    Files are independent, so each one is handled by a worker process.
+    The regex patterns are compiled at module import, which happens once
+    per worker, so tasks never recompile them.
+    
+    Args:
+        file_paths: Paths to the input files
+        max_workers: Number of worker processes (default: one per CPU)
+    
+    Returns:
+        Token data from categorize_tokens() for each file, in input order
+        
+    Raises:
+        FileNotFoundError: If one of the files doesn't exist
     """
-    with open(json_file_name, "w") as json_file:
-        json.dump(data, json_file, indent=4)  # Write with pretty-printing
+    workers = max_workers or os.cpu_count() or 1
+    # Send paths in batches to amortize inter-process communication, while
+    # still giving every worker several batches (one path each when few)
+    chunksize = max(1, len(file_paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_tokenize_file, file_paths, chunksize=chunksize))
 
 
 if __name__ == "__main__":
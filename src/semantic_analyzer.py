@@ -1,8 +1,14 @@
+import math
+import operator
+import sys
+from functools import lru_cache
 from enum import Enum
 from dataclasses import dataclass
-from typing import Union, List, Dict, Optional
+from typing import Union, List, Dict, Optional, Tuple
 
-class SymbolType(Enum):
+# Mixing in str keeps the string values and gives members str's C-level
+# hash, which the type tables hash on every lookup
+class SymbolType(str, Enum):
     INT = 'int'
     FLOAT = 'float'
     CHAR = 'char'
@@ -22,43 +28,124 @@ class FunctionType:
 
 SymbolInfo = Union[SymbolType, ArrayType, FunctionType]
 
+# Type names accepted in declarations
+_TYPE_MAP = {t.value: t for t in SymbolType}
+
+def _symbol_type(type_spec: str) -> SymbolType:
+    try:
+        return _TYPE_MAP[type_spec]
+    except KeyError:
+        raise ValueError(f"'{type_spec}' is not a valid SymbolType") from None
+
+# Symbol table entry
+class SymbolEntry:
+    __slots__ = ('type', 'is_const')
+
+    def __init__(self, type: SymbolInfo, is_const: bool = False):
+        self.type = type
+        self.is_const = is_const
+
+    def __repr__(self):
+        return f"SymbolEntry({self.type!s}, is_const={self.is_const})"
+
 class SymbolTable:
     def __init__(self, parent=None):
-        self.table: Dict[str, Dict] = {}
+        self.table: Dict[str, SymbolEntry] = {}
         self.parent = parent
+        # Tables visible from this scope, innermost first, so lookups are a
+        # flat loop over dicts instead of a recursive walk up the parents
+        self.chain: Tuple[Dict[str, SymbolEntry], ...] = (self.table,) + (parent.chain if parent else ())
     
     def add_symbol(self, name: str, symbol_type: SymbolInfo, is_const: bool = False):
         if name in self.table:
             raise ValueError(f"Variable '{name}' already declared")
-        self.table[name] = {'type': symbol_type, 'is_const': is_const}
+        self.table[name] = SymbolEntry(symbol_type, is_const)
     
-    def check_symbol(self, name: str) -> Dict:
-        if name in self.table:
-            return self.table[name]
-        if self.parent:
-            return self.parent.check_symbol(name)
+    def check_symbol(self, name: str) -> SymbolEntry:
+        for table in self.chain:
+            info = table.get(name)
+            if info is not None:
+                return info
         raise ValueError(f"Variable '{name}' not declared")
 
+_ARITH_OPS = frozenset({'+', '-', '*', '/'})
+_RELOPS = frozenset({'<', '>', '<=', '>=', '==', '!='})
+_LOGOPS = frozenset({'&&', '||'})
+# A tuple rather than a frozenset: array types are unhashable
+_NUMERIC = (SymbolType.INT, SymbolType.FLOAT)
+_ARRAY_INSTRUCTIONS = frozenset({'alloc', 'arraystore', 'arrayload'})
+
+# IR instructions that jump to the label in their result field
+_JUMPS = frozenset({'goto', 'ifnot'})
+# IR instructions after which execution never falls through
+_UNCONDITIONAL_JUMPS = frozenset({'goto', 'return'})
+
 class IntermediateCodeGenerator:
     def __init__(self):
-        self.code: List = []
+        # Instructions are stored column-wise: instruction i is
+        # (ops[i], arg1s[i], arg2s[i], results[i])
+        self.ops: List[str] = []
+        self.arg1s: List = []
+        self.arg2s: List = []
+        self.results: List = []
         self.temp_count = 0
         self.label_count = 0
     
+    @property
+    def code(self) -> Tuple[tuple, ...]:
+        # Built from the columns on each access; emit() is the way to add code
+        return tuple(zip(self.ops, self.arg1s, self.arg2s, self.results))
+    
     def new_temp(self) -> str:
-        temp = f"t{self.temp_count}"
+        # Interned, so every generator shares one string per name
+        temp = sys.intern(f"t{self.temp_count}")
         self.temp_count += 1
         return temp
     
     def new_label(self) -> str:
-        label = f"L{self.label_count}"
+        label = sys.intern(f"L{self.label_count}")
         self.label_count += 1
         return label
     
     def emit(self, op: str, arg1=None, arg2=None, result=None):
-        self.code.append((op, arg1, arg2, result))
+        self.ops.append(op)
+        self.arg1s.append(arg1)
+        self.arg2s.append(arg2)
+        self.results.append(result)
+    
+    def eliminate_dead_code(self):
+        # Drop instructions that follow an unconditional jump and can't be
+        # reached because no label comes before them, and merge labels that
+        # follow each other into the first one
+        keep = []  # Indices of the instructions kept
+        renamed = {}  # Merged label -> label kept in its place
+        reachable = True
+        ops, arg1s = self.ops, self.arg1s
+        for i, op in enumerate(ops):
+            if op == 'label':
+                reachable = True
+                if keep and ops[keep[-1]] == 'label':
+                    renamed[arg1s[i]] = arg1s[keep[-1]]
+                    continue
+            elif not reachable:
+                continue
+            elif op in _UNCONDITIONAL_JUMPS:
+                reachable = False
+            keep.append(i)
+        
+        self.ops = [ops[i] for i in keep]
+        self.arg1s = [arg1s[i] for i in keep]
+        self.arg2s = [self.arg2s[i] for i in keep]
+        self.results = [self.results[i] for i in keep]
+        
+        # Point jumps at the labels that were kept
+        if renamed:
+            self.results = [
+                renamed.get(result, result) if op in _JUMPS else result
+                for op, result in zip(self.ops, self.results)
+            ]
     
-    def get_code(self) -> List:
+    def get_code(self) -> Tuple[tuple, ...]:
         return self.code
 
 class SemanticAnalyzer:
@@ -66,6 +153,27 @@ class SemanticAnalyzer:
         self.current_scope = SymbolTable()
         self.code_gen = IntermediateCodeGenerator()
         self.functions = {}
+        # Code generation handler for each AST node type
+        self._dispatch = {
+            'declaration': self._gen_declaration,
+            'assignment': self._gen_assignment,
+            'binary_op': self._gen_expression,
+            'unary_op': self._gen_expression,
+            'array_access': self._gen_expression,
+            'if': self._gen_if,
+            'while': self._gen_while,
+            'function_call': self._gen_expression,
+            'variable': self._gen_variable,
+            'literal': self._gen_literal,
+        }
+        # Handlers for expression nodes with operands, called by
+        # _gen_expression with the (result, type) pair of each operand
+        self._finishers = {
+            'binary_op': self._finish_binary_op,
+            'unary_op': self._finish_unary_op,
+            'array_access': self._finish_array_access,
+            'function_call': self._finish_function_call,
+        }
     
     def enter_scope(self):
         self.current_scope = SymbolTable(parent=self.current_scope)
@@ -79,10 +187,10 @@ class SemanticAnalyzer:
             if array_size is not None:
                 if array_size <= 0:
                     raise ValueError("Array size must be positive")
-                base_type = SymbolType(type_spec)
+                base_type = _symbol_type(type_spec)
                 symbol_type = ArrayType(base_type, array_size)
             else:
-                symbol_type = SymbolType(type_spec)
+                symbol_type = _symbol_type(type_spec)
             
             self.current_scope.add_symbol(var_name, symbol_type, is_const)
         except ValueError as e:
@@ -92,28 +200,38 @@ class SemanticAnalyzer:
         try:
             var_info = self.current_scope.check_symbol(var_name)
             
-            if var_info['is_const']:
+            if var_info.is_const:
                 raise ValueError(f"Cannot assign to constant '{var_name}'")
             
             # Handle array assignment
-            if isinstance(var_info['type'], ArrayType):
+            if var_info.type.__class__ is ArrayType:
                 raise ValueError(f"Cannot directly assign to array '{var_name}'")
             
             # Type checking
-            if var_info['type'] != expr_type:
+            if var_info.type != expr_type:
                 # Allow implicit int to float conversion
-                if var_info['type'] == SymbolType.FLOAT and expr_type == SymbolType.INT:
+                if var_info.type == SymbolType.FLOAT and expr_type == SymbolType.INT:
                     return SymbolType.FLOAT
                 raise ValueError(f"Type mismatch in assignment to '{var_name}'")
             
-            return var_info['type']
+            return var_info.type
         except ValueError as e:
             raise ValueError(f"Assignment error: {str(e)}")
     
-    def analyze_binary_op(self, left_type: SymbolInfo, right_type: SymbolInfo, op: str):
+    @staticmethod
+    def analyze_binary_op(left_type: SymbolInfo, right_type: SymbolInfo, op: str):
+        # Valid operations on scalar types are precomputed; anything else
+        # (invalid types, array operands) goes through the full check
+        try:
+            return _BINARY_OP_RESULTS[left_type, right_type, op]
+        except (KeyError, TypeError):
+            return SemanticAnalyzer.check_binary_op(left_type, right_type, op)
+    
+    @staticmethod
+    def check_binary_op(left_type: SymbolInfo, right_type: SymbolInfo, op: str):
         # Arithmetic operations
-        if op in ['+', '-', '*', '/']:
-            if left_type not in [SymbolType.INT, SymbolType.FLOAT] or right_type not in [SymbolType.INT, SymbolType.FLOAT]:
+        if op in _ARITH_OPS:
+            if left_type not in _NUMERIC or right_type not in _NUMERIC:
                 raise ValueError(f"Invalid operands for '{op}' operation")
             
             # Type promotion: if either operand is float, result is float
@@ -122,16 +240,16 @@ class SemanticAnalyzer:
             return SymbolType.INT
         
         # Relational operations
-        elif op in ['<', '>', '<=', '>=', '==', '!=']:
+        elif op in _RELOPS:
             if left_type != right_type:
                 # Allow comparing int with float
-                if {left_type, right_type} == {SymbolType.INT, SymbolType.FLOAT}:
+                if left_type in _NUMERIC and right_type in _NUMERIC:
                     return SymbolType.BOOL
                 raise ValueError(f"Type mismatch in relational operation '{op}'")
             return SymbolType.BOOL
         
         # Logical operations
-        elif op in ['&&', '||']:
+        elif op in _LOGOPS:
             if left_type != SymbolType.BOOL or right_type != SymbolType.BOOL:
                 raise ValueError(f"Invalid operands for logical '{op}' operation")
             return SymbolType.BOOL
@@ -139,13 +257,21 @@ class SemanticAnalyzer:
         else:
             raise ValueError(f"Unknown operator '{op}'")
     
-    def analyze_unary_op(self, operand_type: SymbolInfo, op: str):
+    @staticmethod
+    def analyze_unary_op(operand_type: SymbolInfo, op: str):
+        try:
+            return _UNARY_OP_RESULTS[operand_type, op]
+        except (KeyError, TypeError):
+            return SemanticAnalyzer.check_unary_op(operand_type, op)
+    
+    @staticmethod
+    def check_unary_op(operand_type: SymbolInfo, op: str):
         if op == '!':
             if operand_type != SymbolType.BOOL:
                 raise ValueError(f"Invalid operand for logical NOT '!' operation")
             return SymbolType.BOOL
         elif op == '-':
-            if operand_type not in [SymbolType.INT, SymbolType.FLOAT]:
+            if operand_type not in _NUMERIC:
                 raise ValueError(f"Invalid operand for unary '-' operation")
             return operand_type
         else:
@@ -155,17 +281,20 @@ class SemanticAnalyzer:
         try:
             array_info = self.current_scope.check_symbol(array_name)
             
-            if not isinstance(array_info['type'], ArrayType):
+            if array_info.type.__class__ is not ArrayType:
                 raise ValueError(f"'{array_name}' is not an array")
             
             if index_type != SymbolType.INT:
                 raise ValueError(f"Array index must be integer")
             
-            return array_info['type'].base_type
+            return array_info.type.base_type
         except ValueError as e:
             raise ValueError(f"Array access error: {str(e)}")
     
-    def analyze_function_call(self, func_name: str, arg_types: List[SymbolInfo]):
+    def declare_function(self, func_name: str, return_type: SymbolInfo, params: List[SymbolInfo]):
+        self.functions[func_name] = {'return_type': return_type, 'params': tuple(params)}
+    
+    def analyze_function_call(self, func_name: str, arg_types: Tuple[SymbolInfo, ...]):
         if func_name not in self.functions:
             raise ValueError(f"Function '{func_name}' not declared")
         
@@ -174,6 +303,11 @@ class SemanticAnalyzer:
         if len(arg_types) != len(func_info['params']):
             raise ValueError(f"Function '{func_name}' expects {len(func_info['params'])} arguments")
         
+        # Fast path for functions declared with a params tuple
+        if arg_types == func_info['params']:
+            return func_info['return_type']
+        
+        # Find the first mismatched argument for the error message
         for i, (arg_type, param_type) in enumerate(zip(arg_types, func_info['params'])):
             if arg_type != param_type:
                 raise ValueError(f"Argument {i+1} type mismatch in call to '{func_name}'")
@@ -181,170 +315,416 @@ class SemanticAnalyzer:
         return func_info['return_type']
     
     def generate_code(self, node):
-        if node['type'] == 'declaration':
-            array_size = node.get('array_size')
-            self.analyze_declaration(node['data_type'], node['var_name'], 
-                                   node.get('is_const', False), array_size)
-            
-            # Initialize array if needed
-            if array_size is not None:
-                self.code_gen.emit('alloc', node['var_name'], array_size)
-        
-        elif node['type'] == 'assignment':
-            # Handle array element assignment
-            if 'index' in node:
-                # Evaluate array index
-                index_result, index_type = self.generate_code(node['index'])
-                
-                # Check array access
-                array_type = self.analyze_array_access(node['var_name'], index_type)
-                
-                # Evaluate expression
-                expr_result, expr_type = self.generate_code(node['expr'])
-                
-                # Check assignment compatibility
-                if array_type != expr_type:
-                    raise ValueError(f"Array element type mismatch in assignment to '{node['var_name']}'")
-                
-                # Generate code for array store
-                temp = self.code_gen.new_temp()
-                self.code_gen.emit('arraystore', node['var_name'], index_result, expr_result)
-            else:
-                # Regular variable assignment
-                expr_result, expr_type = self.generate_code(node['expr'])
-                result_type = self.analyze_assignment(node['var_name'], expr_type)
-                
-                # Handle implicit type conversion
-                if result_type == SymbolType.FLOAT and expr_type == SymbolType.INT:
-                    temp = self.code_gen.new_temp()
-                    self.code_gen.emit('inttofloat', expr_result, None, temp)
-                    self.code_gen.emit('=', temp, None, node['var_name'])
-                else:
-                    self.code_gen.emit('=', expr_result, None, node['var_name'])
-        
-        elif node['type'] == 'binary_op':
-            left_result, left_type = self.generate_code(node['left'])
-            right_result, right_type = self.generate_code(node['right'])
-            
-            result_type = self.analyze_binary_op(left_type, right_type, node['op'])
-            
-            temp = self.code_gen.new_temp()
-            self.code_gen.emit(node['op'], left_result, right_result, temp)
-            return temp, result_type
-        
-        elif node['type'] == 'unary_op':
-            operand_result, operand_type = self.generate_code(node['operand'])
-            result_type = self.analyze_unary_op(operand_type, node['op'])
-            
-            temp = self.code_gen.new_temp()
-            self.code_gen.emit(node['op'], operand_result, None, temp)
-            return temp, result_type
+        handler = self._dispatch.get(node['type'])
+        if handler is None:
+            return None, None
+        return handler(node)
+    
+    def _gen_declaration(self, node):
+        array_size = node.get('array_size')
+        self.analyze_declaration(node['data_type'], node['var_name'], 
+                               node.get('is_const', False), array_size)
         
-        elif node['type'] == 'array_access':
-            array_info = self.current_scope.check_symbol(node['array_name'])
+        # Initialize array if needed
+        if array_size is not None:
+            self.code_gen.emit('alloc', node['var_name'], array_size)
+        return None, None
+    
+    def _gen_assignment(self, node):
+        code_gen = self.code_gen
+        # Handle array element assignment
+        if 'index' in node:
+            # Evaluate array index
             index_result, index_type = self.generate_code(node['index'])
             
-            element_type = self.analyze_array_access(node['array_name'], index_type)
-            
-            temp = self.code_gen.new_temp()
-            self.code_gen.emit('arrayload', node['array_name'], index_result, temp)
-            return temp, element_type
-        
-        elif node['type'] == 'if':
-            # Evaluate condition
-            cond_result, cond_type = self.generate_code(node['condition'])
-            
-            if cond_type != SymbolType.BOOL:
-                raise ValueError("If condition must be boolean")
-            
-            # Create labels
-            else_label = self.code_gen.new_label()
-            end_label = self.code_gen.new_label()
-            
-            # Emit conditional jump
-            self.code_gen.emit('ifnot', cond_result, None, else_label)
-            
-            # Generate then block
-            self.generate_code(node['then_block'])
-            
-            # Jump to end if there's an else
-            if 'else_block' in node:
-                self.code_gen.emit('goto', None, None, end_label)
-            
-            # Emit else label
-            self.code_gen.emit('label', else_label, None, None)
-            
-            # Generate else block if exists
-            if 'else_block' in node:
-                self.generate_code(node['else_block'])
-                self.code_gen.emit('label', end_label, None, None)
-        
-        elif node['type'] == 'while':
-            # Create labels
-            start_label = self.code_gen.new_label()
-            end_label = self.code_gen.new_label()
+            # Check array access
+            array_type = self.analyze_array_access(node['var_name'], index_type)
             
-            # Emit start label
-            self.code_gen.emit('label', start_label, None, None)
+            # Evaluate expression
+            expr_result, expr_type = self.generate_code(node['expr'])
             
-            # Evaluate condition
-            cond_result, cond_type = self.generate_code(node['condition'])
+            # Check assignment compatibility
+            if array_type != expr_type:
+                raise ValueError(f"Array element type mismatch in assignment to '{node['var_name']}'")
             
-            if cond_type != SymbolType.BOOL:
-                raise ValueError("While condition must be boolean")
-            
-            # Emit conditional jump
-            self.code_gen.emit('ifnot', cond_result, None, end_label)
-            
-            # Generate body
-            self.generate_code(node['body'])
-            
-            # Jump back to start
-            self.code_gen.emit('goto', None, None, start_label)
-            
-            # Emit end label
-            self.code_gen.emit('label', end_label, None, None)
-        
-        elif node['type'] == 'function_call':
-            # Evaluate arguments
-            arg_results = []
-            arg_types = []
-            for arg in node['args']:
-                res, typ = self.generate_code(arg)
-                arg_results.append(res)
-                arg_types.append(typ)
-            
-            # Check function call semantics
-            return_type = self.analyze_function_call(node['func_name'], arg_types)
-            
-            # Generate call code
-            if return_type != SymbolType.INT:  # Void function
-                self.code_gen.emit('call', node['func_name'], arg_results)
+            # Generate code for array store
+            temp = code_gen.new_temp()
+            code_gen.emit('arraystore', node['var_name'], index_result, expr_result)
+        else:
+            # Regular variable assignment
+            expr_result, expr_type = self.generate_code(node['expr'])
+            result_type = self.analyze_assignment(node['var_name'], expr_type)
+            
+            # Handle implicit type conversion
+            if result_type == SymbolType.FLOAT and expr_type == SymbolType.INT:
+                temp = code_gen.new_temp()
+                code_gen.emit('inttofloat', expr_result, None, temp)
+                code_gen.emit('=', temp, None, node['var_name'])
             else:
-                temp = self.code_gen.new_temp()
-                self.code_gen.emit('call', node['func_name'], arg_results, temp)
-                return temp, return_type
+                code_gen.emit('=', expr_result, None, node['var_name'])
+        return None, None
+    
+    def _gen_expression(self, root):
+        # Post-order walk with an explicit stack instead of recursion, so
+        # deeply nested expressions can't hit the recursion limit. A node is
+        # visited once to push its operands and once more when their results
+        # are on top of the results stack.
+        results = []
+        stack = [(root, False)]
+        # Bound once, the loop runs for every node of the expression
+        push, pop, push_result = stack.append, stack.pop, results.append
+        get_finisher, generate_code = self._finishers.get, self.generate_code
+        while stack:
+            node, operands_ready = pop()
+            finish = get_finisher(node['type'])
+            
+            # Variables and literals
+            if finish is None:
+                push_result(generate_code(node))
+                continue
+            
+            operands = _expression_operands(node)
+            if operands_ready:
+                start = len(results) - len(operands)
+                operand_results = results[start:]
+                del results[start:]
+                push_result(finish(node, operand_results))
+            else:
+                # Arrays must be declared before their index is evaluated
+                if node['type'] == 'array_access':
+                    self.current_scope.check_symbol(node['array_name'])
+                
+                push((node, True))
+                # Reversed so operands are generated left to right
+                stack.extend((operand, False) for operand in reversed(operands))
         
-        elif node['type'] == 'variable':
-            var_info = self.current_scope.check_symbol(node['name'])
-            return node['name'], var_info['type']
+        return results[0]
+    
+    def _finish_binary_op(self, node, operands):
+        (left_result, left_type), (right_result, right_type) = operands
         
-        elif node['type'] == 'literal':
-            value = node['value']
-            
-            # Determine type from literal value
-            if isinstance(value, bool):
-                return value, SymbolType.BOOL
-            elif isinstance(value, int):
-                return value, SymbolType.INT
-            elif isinstance(value, float):
-                return value, SymbolType.FLOAT
-            elif isinstance(value, str) and len(value) == 1:
-                return value, SymbolType.CHAR
-            else:
-                raise ValueError(f"Invalid literal value: {value}")
+        result_type = self.analyze_binary_op(left_type, right_type, node['op'])
         
+        code_gen = self.code_gen
+        temp = code_gen.new_temp()
+        code_gen.emit(node['op'], left_result, right_result, temp)
+        return temp, result_type
+    
+    def _finish_unary_op(self, node, operands):
+        (operand_result, operand_type), = operands
+        result_type = self.analyze_unary_op(operand_type, node['op'])
+        
+        code_gen = self.code_gen
+        temp = code_gen.new_temp()
+        code_gen.emit(node['op'], operand_result, None, temp)
+        return temp, result_type
+    
+    def _finish_array_access(self, node, operands):
+        (index_result, index_type), = operands
+        
+        element_type = self.analyze_array_access(node['array_name'], index_type)
+        
+        code_gen = self.code_gen
+        temp = code_gen.new_temp()
+        code_gen.emit('arrayload', node['array_name'], index_result, temp)
+        return temp, element_type
+    
+    def _gen_if(self, node):
+        code_gen = self.code_gen
+        # Evaluate condition
+        cond_result, cond_type = self.generate_code(node['condition'])
+        
+        if cond_type != SymbolType.BOOL:
+            raise ValueError("If condition must be boolean")
+        
+        # Create labels
+        else_label = code_gen.new_label()
+        end_label = code_gen.new_label()
+        
+        # Emit conditional jump
+        code_gen.emit('ifnot', cond_result, None, else_label)
+        
+        # Generate then block
+        self.generate_code(node['then_block'])
+        
+        # Jump to end if there's an else
+        if 'else_block' in node:
+            code_gen.emit('goto', None, None, end_label)
+        
+        # Emit else label
+        code_gen.emit('label', else_label, None, None)
+        
+        # Generate else block if exists
+        if 'else_block' in node:
+            self.generate_code(node['else_block'])
+            code_gen.emit('label', end_label, None, None)
+        return None, None
+    
+    def _gen_while(self, node):
+        code_gen = self.code_gen
+        # Create labels
+        start_label = code_gen.new_label()
+        end_label = code_gen.new_label()
+        
+        # Emit start label
+        code_gen.emit('label', start_label, None, None)
+        
+        # Evaluate condition
+        cond_result, cond_type = self.generate_code(node['condition'])
+        
+        if cond_type != SymbolType.BOOL:
+            raise ValueError("While condition must be boolean")
+        
+        # Emit conditional jump
+        code_gen.emit('ifnot', cond_result, None, end_label)
+        
+        # Generate body
+        self.generate_code(node['body'])
+        
+        # Jump back to start
+        code_gen.emit('goto', None, None, start_label)
+        
+        # Emit end label
+        code_gen.emit('label', end_label, None, None)
         return None, None
+    
+    def _finish_function_call(self, node, operands):
+        # Evaluated arguments
+        arg_results = [res for res, typ in operands]
+        arg_types = tuple(typ for res, typ in operands)
+        
+        # Check function call semantics
+        return_type = self.analyze_function_call(node['func_name'], arg_types)
+        
+        # Generate call code
+        code_gen = self.code_gen
+        if return_type != SymbolType.INT:  # Void function
+            code_gen.emit('call', node['func_name'], arg_results)
+            return None, None
+        temp = code_gen.new_temp()
+        code_gen.emit('call', node['func_name'], arg_results, temp)
+        return temp, return_type
+    
+    def _gen_variable(self, node):
+        var_info = self.current_scope.check_symbol(node['name'])
+        return node['name'], var_info.type
+    
+    def _gen_literal(self, node):
+        value = node['value']
+        
+        # Determine type from literal value
+        if isinstance(value, bool):
+            return value, SymbolType.BOOL
+        elif isinstance(value, int):
+            return value, SymbolType.INT
+        elif isinstance(value, float):
+            return value, SymbolType.FLOAT
+        elif isinstance(value, str) and len(value) == 1:
+            return value, SymbolType.CHAR
+        else:
+            raise ValueError(f"Invalid literal value: {value}")
+
+def _expression_operands(node) -> List[dict]:
+    # Operand nodes of an expression, in evaluation order
+    node_type = node['type']
+    if node_type == 'binary_op':
+        return [node['left'], node['right']]
+    if node_type == 'function_call':
+        return node['args']
+    if node_type == 'unary_op':
+        return [node['operand']]
+    return [node['index']]  # array_access
+
+# Result type of every valid operation on scalar types, so the analyzer
+# resolves them with a single dict lookup. Built once at import time.
+_BINARY_OPERATORS = ('+', '-', '*', '/', '<', '>', '<=', '>=', '==', '!=', '&&', '||')
+_UNARY_OPERATORS = ('!', '-')
+
+def _build_binary_op_results():
+    results = {}
+    for left_type in SymbolType:
+        for right_type in SymbolType:
+            for op in _BINARY_OPERATORS:
+                try:
+                    results[left_type, right_type, op] = SemanticAnalyzer.check_binary_op(left_type, right_type, op)
+                except ValueError:
+                    pass
+    return results
+
+def _build_unary_op_results():
+    results = {}
+    for operand_type in SymbolType:
+        for op in _UNARY_OPERATORS:
+            try:
+                results[operand_type, op] = SemanticAnalyzer.check_unary_op(operand_type, op)
+            except ValueError:
+                pass
+    return results
+
+_BINARY_OP_RESULTS = _build_binary_op_results()
+_UNARY_OP_RESULTS = _build_unary_op_results()
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _divide(left, right):
+    # Integer division truncates toward zero, like in C
+    if isinstance(left, int) and isinstance(right, int):
+        quotient = abs(left) // abs(right)
+        return quotient if (left < 0) == (right < 0) else -quotient
+    return left / right
+
+# Compile-time implementation of each operator, used by fold_constants
+_ARITHMETIC_FOLDS = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': _divide}
+_RELATIONAL_FOLDS = {'<': operator.lt, '>': operator.gt, '<=': operator.le,
+                     '>=': operator.ge, '==': operator.eq, '!=': operator.ne}
+_LOGICAL_FOLDS = {'&&': lambda left, right: left and right, '||': lambda left, right: left or right}
+
+_NOT_FOLDED = object()
+
+def _is_valid_literal(value) -> bool:
+    # Values _gen_literal accepts: bool, int, float or a single char
+    return isinstance(value, (int, float)) or (isinstance(value, str) and len(value) == 1)
+
+def _fold_binary(op, left, right):
+    # Only fold operations the analyzer accepts, so type errors are still reported
+    if not (_is_valid_literal(left) and _is_valid_literal(right)):
+        return _NOT_FOLDED
+    if op in _ARITHMETIC_FOLDS:
+        if not (_is_number(left) and _is_number(right)):
+            return _NOT_FOLDED
+        if op == '/' and right == 0:
+            return _NOT_FOLDED  # Left for run time
+        try:
+            return _ARITHMETIC_FOLDS[op](left, right)
+        except ArithmeticError:  # e.g. an int too large to convert to float
+            return _NOT_FOLDED
+    if op in _RELATIONAL_FOLDS:
+        if not (_is_number(left) and _is_number(right)) and type(left) is not type(right):
+            return _NOT_FOLDED
+        return _RELATIONAL_FOLDS[op](left, right)
+    if op in _LOGICAL_FOLDS:
+        if not (isinstance(left, bool) and isinstance(right, bool)):
+            return _NOT_FOLDED
+        return _LOGICAL_FOLDS[op](left, right)
+    return _NOT_FOLDED
+
+def _fold_unary(op, operand):
+    if op == '-' and _is_number(operand):
+        return -operand
+    if op == '!' and isinstance(operand, bool):
+        return not operand
+    return _NOT_FOLDED
+
+def make_literal(value) -> dict:
+    """
+    Returns a literal AST node for a hashable value. Equal values of the same
+    type share one node, so the result must never be mutated; copy it first.
+    """
+    # 0.0 == -0.0, so floats are also keyed on their sign to keep them apart
+    sign = math.copysign(1.0, value) if type(value) is float else None
+    return _shared_literal(value, sign)
+
+@lru_cache(maxsize=4096, typed=True)
+def _shared_literal(value, sign) -> dict:
+    return {'type': 'literal', 'value': value}
+
+def fold_constants(node):
+    """
+    Returns a copy of an AST where operations on literals are replaced by
+    their result, and 'if' statements with a literal condition by the
+    branch that is taken. Run it before generate_code. Literal nodes in
+    the result come from make_literal and are shared, so they must never
+    be mutated.
+    """
+    # Post-order walk with an explicit stack, like _gen_expression, so deeply
+    # nested trees can't hit the recursion limit. Nodes and lists are visited
+    # once to push their values and once more to rebuild them from the
+    # folded values on top of the results stack.
+    results = []
+    stack = [(node, False)]
+    push, pop, push_result = stack.append, stack.pop, results.append
+    while stack:
+        value, children_ready = pop()
+        is_node = isinstance(value, dict) and 'type' in value
+        if not (is_node or isinstance(value, list)):
+            push_result(value)
+            continue
+        
+        if children_ready:
+            start = len(results) - len(value)
+            children = results[start:]
+            del results[start:]
+            if is_node:
+                push_result(_fold_node(dict(zip(value, children))))
+            else:
+                push_result(children)
+        elif is_node and value['type'] == 'literal' and len(value) == 2:
+            try:
+                push_result(make_literal(value['value']))
+            except TypeError:  # Unhashable value
+                push_result(dict(value))
+        else:
+            push((value, True))
+            # Reversed so values are folded in order
+            stack.extend((child, False) for child in reversed(list(value.values() if is_node else value)))
+    
+    return results[0]
+
+def _fold_node(node):
+    # Folds a node whose children are already folded
+    node_type = node['type']
+    if node_type == 'binary_op':
+        left, right = node['left'], node['right']
+        if left['type'] == 'literal' and right['type'] == 'literal':
+            value = _fold_binary(node['op'], left['value'], right['value'])
+            if value is not _NOT_FOLDED:
+                return make_literal(value)
+    
+    elif node_type == 'unary_op':
+        operand = node['operand']
+        if operand['type'] == 'literal':
+            value = _fold_unary(node['op'], operand['value'])
+            if value is not _NOT_FOLDED:
+                return make_literal(value)
+    
+    elif node_type == 'if':
+        condition = node['condition']
+        if condition['type'] == 'literal' and isinstance(condition['value'], bool):
+            if condition['value']:
+                return node['then_block']
+            return node.get('else_block', {'type': 'block', 'statements': []})
+    
+    return node
+
+def _format_call(op, arg1, arg2, result):
+    args = ', '.join(map(str, arg2)) if arg2 else ''
+    if result:
+        return f"{result} = call {arg1}({args})"
+    return f"call {arg1}({args})"
+
+def _format_default(op, arg1, arg2, result):
+    if arg2 is not None:
+        return f"{result} = {arg1} {op} {arg2}"
+    return f"{result} = {arg1}"
+
+def _format_array(op, arg1, arg2, result):
+    return f"{op} {arg1}, {arg2}, {result}"
+
+# Text form of each IR instruction, keyed by opcode
+_PRINTERS = {
+    'label': lambda op, arg1, arg2, result: f"{arg1}:",
+    'ifnot': lambda op, arg1, arg2, result: f"ifnot {arg1} goto {result}",
+    'goto': lambda op, arg1, arg2, result: f"goto {result}",
+    'call': _format_call,
+    **dict.fromkeys(_ARRAY_INSTRUCTIONS, _format_array),
+}
+
+def format_code(code) -> str:
+    """Render IR instructions as text, one instruction per line."""
+    lines = [_PRINTERS.get(instr[0], _format_default)(*instr) for instr in code]
+    lines.append('')
+    return '\n'.join(lines)
 
 if __name__ == "__main__":
     ast = [
@@ -511,35 +891,15 @@ if __name__ == "__main__":
 
     analyzer = SemanticAnalyzer()
     
-    analyzer.functions['factorial'] = {
-        'return_type': SymbolType.INT,
-        'params': [SymbolType.INT]
-    }
+    analyzer.declare_function('factorial', SymbolType.INT, [SymbolType.INT])
     
     # Process AST
     for node in ast:
         if node['type'] == 'function_decl':
             continue
-        analyzer.generate_code(node)
+        analyzer.generate_code(fold_constants(node))
+    analyzer.code_gen.eliminate_dead_code()
     
     # Print generated intermediate code
     print("Generated Intermediate Code:")
-    for op, arg1, arg2, result in analyzer.code_gen.get_code():
-        if op == 'label':
-            print(f"{result}:")
-        elif op == 'ifnot':
-            print(f"ifnot {arg1} goto {result}")
-        elif op == 'goto':
-            print(f"goto {result}")
-        elif op in ['alloc', 'arraystore', 'arrayload']:
-            print(f"{op} {arg1}, {arg2}, {result}")
-        elif op == 'call':
-            args = ', '.join(map(str, arg2)) if arg2 else ''
-            if result:
-                print(f"{result} = call {arg1}({args})")
-            else:
-                print(f"call {arg1}({args})")
-        elif arg2 is not None:
-            print(f"{result} = {arg1} {op} {arg2}")
-        else:
-            print(f"{result} = {arg1}")
\ No newline at end of file
+    sys.stdout.write(format_code(analyzer.code_gen.get_code()))
\ No newline at end of file
@@ -33,8 +33,18 @@ class TokenType(Enum):
     LET = 14
     EOF = 15
 
+# Binding power of each binary operator; tokens not listed end an expression
+PRECEDENCE = {
+    TokenType.PLUS: 1,
+    TokenType.MINUS: 1,
+    TokenType.MUL: 2,
+    TokenType.DIV: 2,
+}
+
 # Token structure with position information
 class Token:
+    __slots__ = ('type', 'value', 'line', 'column')
+
     def __init__(self, type, value=None, line=None, column=None):
         self.type = type
         self.value = value
@@ -46,9 +56,11 @@ class Token:
 
 # AST Node Classes
 class ASTNode:
-    pass
+    __slots__ = ()
 
 class Program(ASTNode):
+    __slots__ = ('statements',)
+
     def __init__(self, statements):
         self.statements = statements
 
@@ -56,6 +68,8 @@ class Program(ASTNode):
         return f"Program({self.statements})"
 
 class VarDecl(ASTNode):
+    __slots__ = ('identifier', 'initializer')
+
     def __init__(self, identifier, initializer):
         self.identifier = identifier
         self.initializer = initializer
@@ -64,6 +78,8 @@ class VarDecl(ASTNode):
         return f"VarDecl({self.identifier}, {self.initializer})"
 
 class Assignment(ASTNode):
+    __slots__ = ('identifier', 'value')
+
     def __init__(self, identifier, value):
         self.identifier = identifier
         self.value = value
@@ -72,6 +88,8 @@ class Assignment(ASTNode):
         return f"Assignment({self.identifier}, {self.value})"
 
 class BinOp(ASTNode):
+    __slots__ = ('left', 'op', 'right')
+
     def __init__(self, left, op, right):
         self.left = left
         self.op = op
@@ -81,6 +99,8 @@ class BinOp(ASTNode):
         return f"BinOp({self.left}, {self.op.type.name}, {self.right})"
 
 class Num(ASTNode):
+    __slots__ = ('token', 'value')
+
     def __init__(self, token):
         self.token = token
         self.value = token.value
@@ -89,6 +109,8 @@ class Num(ASTNode):
         return f"Num({self.value})"
 
 class Var(ASTNode):
+    __slots__ = ('token', 'value')
+
     def __init__(self, token):
         self.token = token
         self.value = token.value
@@ -99,7 +121,11 @@ class Var(ASTNode):
 # Parser with enhanced error handling
 class Parser:
     def __init__(self, tokens):
-        self.tokens = tokens
+        self.tokens = list(tokens)
+        # Make sure the stream ends with EOF. parse() stops there and EOF is
+        # never eaten, so eat() can advance without a bounds check
+        if not self.tokens or self.tokens[-1].type != TokenType.EOF:
+            self.tokens.append(Token(TokenType.EOF))
         self.current_token = self.tokens[0]
         self.pos = 0
 
@@ -115,13 +141,15 @@ class Parser:
     def eat(self, token_type):
         if self.current_token.type == token_type:
             self.pos += 1
-            if self.pos < len(self.tokens):
-                self.current_token = self.tokens[self.pos]
-            else:
-                self.current_token = Token(TokenType.EOF)
+            self.current_token = self.tokens[self.pos]
         else:
             self.error(expected=token_type.name)
 
+    def peek_type(self):
+        # Type of the token after the current one. Only valid while the
+        # current token is not EOF, which always has a successor otherwise
+        return self.tokens[self.pos + 1].type
+
     def factor(self):
         token = self.current_token
         if token.type == TokenType.INTEGER or token.type == TokenType.FLOAT:
@@ -138,25 +166,25 @@ class Parser:
         else:
             self.error(expected="number, identifier, or '('")
 
-    def term(self):
+    def parse_expression(self, min_prec=1):
+        # Precedence climbing: the loop consumes operators binding at least
+        # as tightly as min_prec, left-associatively; the recursive call
+        # parses right operands that bind tighter still
         node = self.factor()
-
-        while self.current_token.type in (TokenType.MUL, TokenType.DIV):
+        precedence = PRECEDENCE
+        while True:
             token = self.current_token
+            prec = precedence.get(token.type, 0)
+            if prec < min_prec:
+                return node
             self.eat(token.type)
-            node = BinOp(left=node, op=token, right=self.factor())
+            node = BinOp(left=node, op=token, right=self.parse_expression(prec + 1))
 
-        return node
+    def term(self):
+        return self.parse_expression(PRECEDENCE[TokenType.MUL])
 
     def expr(self):
-        node = self.term()
-
-        while self.current_token.type in (TokenType.PLUS, TokenType.MINUS):
-            token = self.current_token
-            self.eat(token.type)
-            node = BinOp(left=node, op=token, right=self.term())
-
-        return node
+        return self.parse_expression(PRECEDENCE[TokenType.PLUS])
 
     def assignment(self):
         identifier = self.current_token.value
@@ -177,8 +205,7 @@ class Parser:
         if self.current_token.type == TokenType.LET:
             return self.var_decl()
         elif self.current_token.type == TokenType.IDENTIFIER and \
-             len(self.tokens) > self.pos + 1 and \
-             self.tokens[self.pos + 1].type == TokenType.ASSIGN:
+             self.peek_type() is TokenType.ASSIGN:
             return self.assignment()
         else:
             return self.expr()
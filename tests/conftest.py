@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+# Make the project root importable, so tests can import from src. Run the
+# suite from the project root with either of:
+#   python -m pytest
+#   python -m unittest discover -s tests -p '*_test.py'
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -1,91 +1,121 @@
 import unittest
 import os
 import tempfile
-import sys
+import shutil
 import re
+import threading
 
-from pathlib import Path
+from unittest.mock import patch
 
-# Add the project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+import src.lexical_analyzer as lexical_analyzer
+from src.lexical_analyzer import read_text_file, tokenize_files
 
-from src.lexical_analyzer import read_text_file
+def write_fixture(path, content):
+    # Written through a raw file descriptor, without a text-mode wrapper.
+    # O_BINARY keeps Windows from translating newlines.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        os.write(fd, content.encode('utf-8'))
+    finally:
+        os.close(fd)
+
+# Contents of the fixture files, written once for the whole test class
+FIXTURES = {
+    'normal': "line1 word1\nline2 word2\nline3 word3",
+    'single_comments': "valid1 valid2\n//comment\nvalid3 valid4\n//comment",
+    'multi_comments': "before\n/* comment\nspanning\nmultiple\nlines */\nafter",
+    'unclosed_comment': "valid\n/* unclosed comment\nshould skip this",
+    'empty_lines': "\n\nvalid\n\n\n",
+    'mixed_comments': "valid1\n// line comment\nvalid2\n/* block\ncomment */\nvalid3",
+    'adjacent_punctuation': "x=42;\nf(a,b)",
+    'inline_comments': "a = 1; // trailing\nb /* inline */ = 2;\n/* block\nend */ c",
+    'comment_between_tokens': "a/* inline */b",
+    'assignment': "x = 1;",
+    'condition': "if ( y )",
+}
+
+# Fixture name and the lines of tokens read_text_file() should return
+READ_CASES = [
+    # Normal file without comments
+    ('normal', [['line1', 'word1'], ['line2', 'word2'], ['line3', 'word3']]),
+    # // single-line comments
+    ('single_comments', [['valid1', 'valid2'], ['valid3', 'valid4']]),
+    # /* */ multi-line comments
+    ('multi_comments', [['before'], ['after']]),
+    # Unclosed multi-line comment runs to the end of the file
+    ('unclosed_comment', [['valid']]),
+    ('empty_lines', [['valid']]),
+    ('mixed_comments', [['valid1'], ['valid2'], ['valid3']]),
+    # Punctuation touching other tokens is split off
+    ('adjacent_punctuation', [['x', '=', '42', ';'], ['f', '(', 'a', ',', 'b', ')']]),
+    # Comments that share a line with code
+    ('inline_comments', [['a', '=', '1', ';'], ['b', '=', '2', ';'], ['c']]),
+    # A comment still separates the tokens around it
+    ('comment_between_tokens', [['a', 'b']]),
+]
 
 class TestReadTextFile(unittest.TestCase):
-    def setUp(self):
-        # Create a temporary directory
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.test_file_path = os.path.join(self.temp_dir.name, 'test.txt')
+    @classmethod
+    def setUpClass(cls):
+        # Create a temporary directory with every fixture file
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.paths = {}
+        for name, content in FIXTURES.items():
+            path = os.path.join(cls.temp_dir, f'{name}.txt')
+            write_fixture(path, content)
+            cls.paths[name] = path
     
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         # Clean up the temporary directory
-        self.temp_dir.cleanup()
-    
-    def test_read_normal_file(self):
-        """Test reading a normal file without comments"""
-        content = "line1 word1\nline2 word2\nline3 word3"
-        with open(self.test_file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        expected = [['line1', 'word1'], ['line2', 'word2'], ['line3', 'word3']]
-        result = read_text_file(self.test_file_path)
-        self.assertEqual(result, expected)
-    
-    def test_filter_single_line_comments(self):
-        """Test filtering of // single-line comments"""
-        content = "valid1 valid2\n//comment\nvalid3 valid4\n//comment"
-        with open(self.test_file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        expected = [['valid1', 'valid2'], ['valid3', 'valid4']]
-        result = read_text_file(self.test_file_path)
-        self.assertEqual(result, expected)
-    
-    def test_filter_multi_line_comments(self):
-        """Test filtering of /* */ multi-line comments"""
-        content = "before\n/* comment\nspanning\nmultiple\nlines */\nafter"
-        with open(self.test_file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        expected = [['before'], ['after']]
-        result = read_text_file(self.test_file_path)
-        self.assertEqual(result, expected)
-    
-    def test_unclosed_multi_line_comment(self):
-        """Test behavior with unclosed multi-line comment"""
-        content = "valid\n/* unclosed comment\nshould skip this"
-        with open(self.test_file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        expected = [['valid']]
-        result = read_text_file(self.test_file_path)
-        self.assertEqual(result, expected)
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
     
-    def test_empty_lines(self):
-        """Test handling of empty lines"""
-        content = "\n\nvalid\n\n\n"
-        with open(self.test_file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        expected = [['valid']]
-        result = read_text_file(self.test_file_path)
-        self.assertEqual(result, expected)
+    def test_read_files(self):
+        """Test tokenizing each fixture, comments and empty lines dropped"""
+        for name, expected in READ_CASES:
+            with self.subTest(name=name):
+                self.assertEqual(read_text_file(self.paths[name]), expected)
     
     def test_file_not_found(self):
         """Test FileNotFoundError is raised for non-existent files"""
         with self.assertRaises(FileNotFoundError):
             read_text_file("nonexistent_file.txt")
-    
-    def test_mixed_comments(self):
-        """Test files with mixed comments"""
-        content = "valid1\n// line comment\nvalid2\n/* block\ncomment */\nvalid3"
-        with open(self.test_file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        expected = [['valid1'], ['valid2'], ['valid3']]
-        result = read_text_file(self.test_file_path)
-        self.assertEqual(result, expected)
+
+    def test_utf16_file(self):
+        """Test reading a file in an encoding that is not ASCII-compatible"""
+        path = os.path.join(self.temp_dir, 'utf16.txt')
+        with open(path, 'w', encoding='utf-16') as file:
+            file.write(FIXTURES['inline_comments'])
+        self.assertEqual(read_text_file(path, encoding='utf-16'), [['a', '=', '1', ';'], ['b', '=', '2', ';'], ['c']])
+
+    @unittest.skipUnless(hasattr(os, 'mkfifo'), "requires os.mkfifo")
+    def test_fifo(self):
+        """Test reading from a pipe, whose size is always reported as 0"""
+        path = os.path.join(self.temp_dir, 'fifo')
+        os.mkfifo(path)
+        writer = threading.Thread(target=write_fixture, args=(path, FIXTURES['normal']))
+        writer.start()
+        try:
+            self.assertEqual(read_text_file(path), [['line1', 'word1'], ['line2', 'word2'], ['line3', 'word3']])
+        finally:
+            writer.join()
+
+    def test_patterns_compiled_once(self):
+        """Test that reading a file only uses the precompiled patterns"""
+        self.assertIsInstance(lexical_analyzer._RE_TOKEN, re.Pattern)
+        self.assertIsInstance(lexical_analyzer._RE_COMMENT, re.Pattern)
+        # Any re.X(...) call made while reading would fail on None
+        with patch.object(lexical_analyzer, 're', None):
+            result = read_text_file(self.paths['mixed_comments'])
+        self.assertEqual(result, [['valid1'], ['valid2'], ['valid3']])
+
+    def test_tokenize_files(self):
+        """Test tokenizing several files in parallel keeps input order"""
+        paths = [self.paths['assignment'], self.paths['condition']]
+        results = tokenize_files(paths, max_workers=2)
+        self.assertEqual([r['content'] for r in results], [['x', '=', '1', ';'], ['if', '(', 'y', ')']])
+        self.assertEqual(results[1]['type'], ['keyword', 'delimiters', 'identifier', 'delimiters'])
     """
     @patch('builtins.open', side_effect=UnicodeDecodeError('utf-8', b'', 0, 1, 'invalid byte'))
     def test_encoding_error(self, mock_open):
@@ -93,7 +123,3 @@ class TestReadTextFile(unittest.TestCase):
         with self.assertRaises(UnicodeDecodeError):
             read_text_file(self.test_file_path)
     """
-            
-            
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
@@ -1,14 +1,10 @@
 import unittest
 from enum import Enum
-import sys
-from pathlib import Path
-
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root)) 
 
 from src.semantic_analyzer import (
     SymbolType, ArrayType, SymbolTable, 
-    IntermediateCodeGenerator, SemanticAnalyzer
+    IntermediateCodeGenerator, SemanticAnalyzer, fold_constants, format_code,
+    make_literal
 )
 
 class TestSymbolTable(unittest.TestCase):
@@ -18,7 +14,8 @@ class TestSymbolTable(unittest.TestCase):
     def test_add_and_check_symbol(self):
         self.symbol_table.add_symbol("x", SymbolType.INT)
         symbol_info = self.symbol_table.check_symbol("x")
-        self.assertEqual(symbol_info['type'], SymbolType.INT)
+        self.assertEqual(symbol_info.type, SymbolType.INT)
+        self.assertFalse(symbol_info.is_const)
         
     def test_duplicate_declaration(self):
         self.symbol_table.add_symbol("x", SymbolType.INT)
@@ -36,12 +33,23 @@ class TestSymbolTable(unittest.TestCase):
         
         # Can access parent's symbols
         symbol_info = child.check_symbol("x")
-        self.assertEqual(symbol_info['type'], SymbolType.INT)
+        self.assertEqual(symbol_info.type, SymbolType.INT)
         
         # Shadowing
         child.add_symbol("x", SymbolType.FLOAT)
         symbol_info = child.check_symbol("x")
-        self.assertEqual(symbol_info['type'], SymbolType.FLOAT)
+        self.assertEqual(symbol_info.type, SymbolType.FLOAT)
+    
+    def test_shadowing_after_lookup(self):
+        grandparent = SymbolTable()
+        grandparent.add_symbol("x", SymbolType.INT)
+        parent = SymbolTable(parent=grandparent)
+        child = SymbolTable(parent=parent)
+        self.assertEqual(child.check_symbol("x").type, SymbolType.INT)
+        
+        # A declaration in a scope in between hides the earlier result
+        parent.add_symbol("x", SymbolType.BOOL)
+        self.assertEqual(child.check_symbol("x").type, SymbolType.BOOL)
 
 class TestIntermediateCodeGenerator(unittest.TestCase):
     def setUp(self):
@@ -51,6 +59,23 @@ class TestIntermediateCodeGenerator(unittest.TestCase):
         self.code_gen.emit("+", "t1", "t2", "t3")
         self.assertEqual(len(self.code_gen.code), 1)
         self.assertEqual(self.code_gen.code[0], ("+", "t1", "t2", "t3"))
+        self.assertEqual(self.code_gen.ops, ["+"])
+        self.assertEqual(self.code_gen.results, ["t3"])
+    
+    def test_eliminate_dead_code(self):
+        self.code_gen.emit("ifnot", "t0", None, "L1")
+        self.code_gen.emit("goto", None, None, "L0")
+        self.code_gen.emit("=", 1, None, "x")           # Unreachable
+        self.code_gen.emit("label", "L0", None, None)
+        self.code_gen.emit("label", "L1", None, None)   # Merged into L0
+        self.code_gen.emit("=", 2, None, "x")
+        self.code_gen.eliminate_dead_code()
+        self.assertEqual(self.code_gen.code, (
+            ("ifnot", "t0", None, "L0"),
+            ("goto", None, None, "L0"),
+            ("label", "L0", None, None),
+            ("=", 2, None, "x"),
+        ))
     
     def test_new_temp(self):
         temp1 = self.code_gen.new_temp()
@@ -63,6 +88,55 @@ class TestIntermediateCodeGenerator(unittest.TestCase):
         label2 = self.code_gen.new_label()
         self.assertEqual(label1, "L0")
         self.assertEqual(label2, "L1")
+    
+    def test_names_shared_between_generators(self):
+        other = IntermediateCodeGenerator()
+        self.assertIs(self.code_gen.new_temp(), other.new_temp())
+        self.assertIs(self.code_gen.new_label(), other.new_label())
+    
+    def test_format_code(self):
+        analyzer = SemanticAnalyzer()
+        analyzer.declare_function('f', SymbolType.INT, [SymbolType.INT])
+        analyzer.declare_function('g', SymbolType.FLOAT, [])
+        x = {'type': 'variable', 'name': 'x'}
+        empty_block = {'type': 'block', 'statements': []}
+        ast = [
+            {'type': 'declaration', 'data_type': 'int', 'var_name': 'x'},
+            {'type': 'declaration', 'data_type': 'int', 'var_name': 'arr', 'array_size': 10},
+            {'type': 'assignment', 'var_name': 'arr', 'index': {'type': 'literal', 'value': 2}, 'expr': x},
+            {
+                'type': 'assignment',
+                'var_name': 'x',
+                'expr': {
+                    'type': 'function_call',
+                    'func_name': 'f',
+                    'args': [{'type': 'binary_op', 'op': '+', 'left': x, 'right': {'type': 'literal', 'value': 1}}]
+                }
+            },
+            {'type': 'function_call', 'func_name': 'g', 'args': []},
+            {
+                'type': 'while',
+                'condition': {'type': 'binary_op', 'op': '<', 'left': x, 'right': {'type': 'literal', 'value': 10}},
+                'body': empty_block
+            },
+        ]
+        for node in ast:
+            analyzer.generate_code(node)
+        
+        self.assertEqual(format_code(analyzer.code_gen.get_code()), "\n".join([
+            "alloc arr, 10, None",
+            "arraystore arr, 2, x",
+            "t1 = x + 1",
+            "t2 = call f(t1)",
+            "x = t2",
+            "call g()",
+            "L0:",
+            "t3 = x < 10",
+            "ifnot t3 goto L1",
+            "goto L0",
+            "L1:",
+            ""
+        ]))
 
 class TestSemanticAnalyzer(unittest.TestCase):
     def setUp(self):
@@ -73,6 +147,11 @@ class TestSemanticAnalyzer(unittest.TestCase):
         self.analyzer.generate_code(node)
         self.assertIn('x', self.analyzer.current_scope.table)
     
+    def test_unknown_declaration_type(self):
+        node = {'type': 'declaration', 'data_type': 'string', 'var_name': 'x'}
+        with self.assertRaises(ValueError):
+            self.analyzer.generate_code(node)
+    
     def test_array_declaration(self):
         node = {
             'type': 'declaration', 
@@ -82,8 +161,8 @@ class TestSemanticAnalyzer(unittest.TestCase):
         }
         self.analyzer.generate_code(node)
         symbol_info = self.analyzer.current_scope.check_symbol("arr")
-        self.assertIsInstance(symbol_info['type'], ArrayType)
-        self.assertEqual(symbol_info['type'].base_type, SymbolType.FLOAT)
+        self.assertIsInstance(symbol_info.type, ArrayType)
+        self.assertEqual(symbol_info.type.base_type, SymbolType.FLOAT)
     
     def test_assignment(self):
         # Declare variable first
@@ -167,6 +246,17 @@ class TestSemanticAnalyzer(unittest.TestCase):
         }
         with self.assertRaises(ValueError):
             self.analyzer.generate_code(node)
+        
+        # Comparing an array with a number should fail
+        self.analyzer.generate_code({'type': 'declaration', 'data_type': 'int', 'var_name': 'arr', 'array_size': 3})
+        node = {
+            'type': 'binary_op',
+            'op': '<',
+            'left': {'type': 'variable', 'name': 'arr'},
+            'right': {'type': 'literal', 'value': 5}
+        }
+        with self.assertRaises(ValueError):
+            self.analyzer.generate_code(node)
     
     def test_if_statement(self):
         # Declare variable
@@ -223,6 +313,34 @@ class TestSemanticAnalyzer(unittest.TestCase):
         self.assertTrue(any(op == 'goto' for op, _, _, _ in code))
         self.assertEqual(len([op for op, _, _, _ in code if op == 'label']), 2)
     
+    def test_deeply_nested_expression(self):
+        # Deeper than the default recursion limit
+        node = {'type': 'literal', 'value': 1}
+        for _ in range(5000):
+            node = {
+                'type': 'binary_op',
+                'op': '+',
+                'left': node,
+                'right': {'type': 'literal', 'value': 1}
+            }
+        result, typ = self.analyzer.generate_code(node)
+        self.assertEqual(typ, SymbolType.INT)
+        self.assertEqual(result, "t4999")
+        self.assertEqual(len(self.analyzer.code_gen.get_code()), 5000)
+    
+    def test_function_call(self):
+        self.analyzer.declare_function('max', SymbolType.INT, [SymbolType.INT, SymbolType.INT])
+        self.assertEqual(self.analyzer.functions['max']['params'], (SymbolType.INT, SymbolType.INT))
+        
+        call_node = {
+            'type': 'function_call',
+            'func_name': 'max',
+            'args': [{'type': 'literal', 'value': 1}, {'type': 'literal', 'value': 2}]
+        }
+        result, typ = self.analyzer.generate_code(call_node)
+        self.assertEqual(typ, SymbolType.INT)
+        self.assertEqual(self.analyzer.code_gen.get_code()[-1], ('call', 'max', [1, 2], result))
+    
     def test_invalid_function_call(self):
         # Register a function
         self.analyzer.functions['pow'] = {
@@ -270,6 +388,131 @@ class TestSemanticAnalyzer(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.analyzer.generate_code(assign_node)
 
+class TestConstantFolding(unittest.TestCase):
+    def test_fold_nested_arithmetic(self):
+        # 1 + 4 * 9 - 3
+        node = {
+            'type': 'binary_op',
+            'op': '-',
+            'left': {
+                'type': 'binary_op',
+                'op': '+',
+                'left': {'type': 'literal', 'value': 1},
+                'right': {
+                    'type': 'binary_op',
+                    'op': '*',
+                    'left': {'type': 'literal', 'value': 4},
+                    'right': {'type': 'literal', 'value': 9}
+                }
+            },
+            'right': {'type': 'literal', 'value': 3}
+        }
+        self.assertEqual(fold_constants(node), {'type': 'literal', 'value': 34})
+    
+    def test_fold_keeps_types(self):
+        node = {
+            'type': 'binary_op',
+            'op': '/',
+            'left': {'type': 'literal', 'value': -7},
+            'right': {'type': 'literal', 'value': 2}
+        }
+        self.assertEqual(fold_constants(node), {'type': 'literal', 'value': -3})
+        
+        node['right'] = {'type': 'literal', 'value': 2.0}
+        self.assertEqual(fold_constants(node), {'type': 'literal', 'value': -3.5})
+    
+    def test_fold_large_integers(self):
+        node = {
+            'type': 'binary_op',
+            'op': '*',
+            'left': {'type': 'literal', 'value': 2 ** 40},
+            'right': {'type': 'literal', 'value': 2 ** 40}
+        }
+        self.assertEqual(fold_constants(node), {'type': 'literal', 'value': 2 ** 80})
+    
+    def test_fold_deeply_nested_expression(self):
+        # Deeper than the default recursion limit
+        node = {'type': 'literal', 'value': 1}
+        for _ in range(5000):
+            node = {
+                'type': 'binary_op',
+                'op': '+',
+                'left': node,
+                'right': {'type': 'literal', 'value': 1}
+            }
+        self.assertEqual(fold_constants(node), {'type': 'literal', 'value': 5001})
+    
+    def test_shared_literals(self):
+        self.assertIs(make_literal(1), make_literal(1))
+        self.assertIsNot(make_literal(1), make_literal(True))
+        self.assertIsNot(make_literal(1), make_literal(1.0))
+        
+        # -0.0 == 0.0, but they are different literals
+        self.assertEqual(str(make_literal(-0.0)['value']), '-0.0')
+        self.assertEqual(str(make_literal(0.0)['value']), '0.0')
+        node = {'type': 'unary_op', 'op': '-', 'operand': {'type': 'literal', 'value': 0.0}}
+        self.assertEqual(str(fold_constants(node)['value']), '-0.0')
+        
+        # 2 + 3 and 5 fold to the same node
+        node = {
+            'type': 'binary_op',
+            'op': '+',
+            'left': {'type': 'literal', 'value': 2},
+            'right': {'type': 'literal', 'value': 3}
+        }
+        self.assertIs(fold_constants(node), fold_constants({'type': 'literal', 'value': 5}))
+    
+    def test_invalid_operations_not_folded(self):
+        node = {
+            'type': 'binary_op',
+            'op': '+',
+            'left': {'type': 'literal', 'value': True},
+            'right': {'type': 'literal', 'value': 5}
+        }
+        self.assertEqual(fold_constants(node), node)
+        with self.assertRaises(ValueError):
+            SemanticAnalyzer().generate_code(fold_constants(node))
+    
+    def test_invalid_literals_not_folded(self):
+        # 'ab' is not a valid literal, so the error must still be reported
+        node = {
+            'type': 'binary_op',
+            'op': '>',
+            'left': {'type': 'literal', 'value': 'ab'},
+            'right': {'type': 'literal', 'value': 'ab'}
+        }
+        self.assertEqual(fold_constants(node), node)
+        if_node = {'type': 'if', 'condition': node, 'then_block': {'type': 'block', 'statements': []}}
+        with self.assertRaisesRegex(ValueError, "Invalid literal value"):
+            SemanticAnalyzer().generate_code(fold_constants(if_node))
+    
+    def test_overflow_not_folded(self):
+        node = {
+            'type': 'binary_op',
+            'op': '*',
+            'left': {'type': 'literal', 'value': 10 ** 400},
+            'right': {'type': 'literal', 'value': 1.5}
+        }
+        self.assertEqual(fold_constants(node), node)
+        node['op'] = '/'
+        self.assertEqual(fold_constants(node), node)
+    
+    def test_prune_constant_if(self):
+        then_block = {'type': 'block', 'statements': []}
+        else_block = {'type': 'block', 'statements': [{'type': 'literal', 'value': 1}]}
+        node = {
+            'type': 'if',
+            'condition': {
+                'type': 'binary_op',
+                'op': '<',
+                'left': {'type': 'literal', 'value': 2},
+                'right': {'type': 'literal', 'value': 1}
+            },
+            'then_block': then_block,
+            'else_block': else_block
+        }
+        self.assertEqual(fold_constants(node), else_block)
+
 class TestTypeSystem(unittest.TestCase):
     def test_array_type_equality(self):
         arr1 = ArrayType(SymbolType.INT, 10)
@@ -284,6 +527,3 @@ class TestTypeSystem(unittest.TestCase):
         self.assertEqual(SymbolType.FLOAT.value, 'float')
         self.assertEqual(SymbolType.CHAR.value, 'char')
         self.assertEqual(SymbolType.BOOL.value, 'bool')
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
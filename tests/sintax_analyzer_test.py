@@ -1,10 +1,5 @@
 import unittest
 from enum import Enum
-import sys
-from pathlib import Path
-
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root)) 
 
 from src.sintax_analyzer import TokenType, Token, Program, VarDecl, Assignment, BinOp, Num, Var, Parser
 
@@ -140,6 +135,26 @@ class TestParser(unittest.TestCase):
         self.assertIsInstance(top_binop.right, BinOp)
         self.assertEqual(top_binop.right.op.type, TokenType.MUL)
     
+    def test_parse_left_associative(self):
+        tokens = [
+            Token(TokenType.INTEGER, 10),
+            Token(TokenType.MINUS),
+            Token(TokenType.INTEGER, 4),
+            Token(TokenType.MUL),
+            Token(TokenType.INTEGER, 2),
+            Token(TokenType.MINUS),
+            Token(TokenType.INTEGER, 3)
+        ]
+        parser = self.create_parser(tokens)
+        ast = parser.parse()
+        # Should be (10 - (4 * 2)) - 3
+        top_binop = ast.statements[0]
+        self.assertEqual(top_binop.op.type, TokenType.MINUS)
+        self.assertEqual(top_binop.right.value, 3)
+        self.assertEqual(top_binop.left.op.type, TokenType.MINUS)
+        self.assertEqual(top_binop.left.left.value, 10)
+        self.assertEqual(top_binop.left.right.op.type, TokenType.MUL)
+    
     def test_parse_parentheses(self):
         tokens = [
             Token(TokenType.LPAREN),
@@ -201,6 +216,15 @@ class TestParser(unittest.TestCase):
         self.assertIsInstance(ast.statements[1], Assignment)
     
 
+    def test_parse_without_eof(self):
+        tokens = [
+            Token(TokenType.INTEGER, 2),
+            Token(TokenType.PLUS),
+            Token(TokenType.INTEGER, 3)
+        ]
+        ast = Parser(tokens).parse()
+        self.assertEqual(repr(ast), "Program([BinOp(Num(2), PLUS, Num(3))])")
+
     def test_syntax_error_missing_operand(self):
         tokens = [
             Token(TokenType.INTEGER, 1),
@@ -210,7 +234,3 @@ class TestParser(unittest.TestCase):
         with self.assertRaises(Exception) as context:
             parser.parse()
         self.assertIn("Syntax error", str(context.exception))
-    
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file